@@ -20,10 +20,10 @@ Environment Variables Required:
 
 Dependencies:
 -------------
-- decouple: For environment variable management
 - db.postgresql: PostgreSQL connection utilities
 - db.postgresql_queries: Query execution helpers
 - utils.file_handler: JSON and SQL file readers
+- utils.config_handler: Shared environment-driven settings
 - utils.logging_handler: Custom logger for error tracking
 
 Example Usage:
@@ -34,15 +34,12 @@ Example Usage:
 """
 
 
-from decouple import config
-
 import db.postgresql as db
 import db.postgresql_queries as q
 import utils.file_handler as fh
+from utils.config_handler import DB_ROLE, DESTINATION_PATH
 from utils.logging_handler import logger as log
 
-DESTINATION_PATH = f"{config("SQL_PATH")}\\destination"
-
 
 def drop_pg_database(database: str) -> bool:
     """
@@ -67,9 +64,8 @@ def drop_pg_database(database: str) -> bool:
     success = False
 
     try:
-        path = f"{DESTINATION_PATH}\\db_database__DROP.sql"
-        index = path.rfind('\\')+1
-        sql_script = path[index:].strip()
+        path = DESTINATION_PATH / "db_database__DROP.sql"
+        sql_script = path.name
 
         # create database
         success = q.pg_query_from_file(
@@ -79,14 +75,14 @@ def drop_pg_database(database: str) -> bool:
         )
 
         if success:
-            log.info(f"🟢 SUCCESS: {sql_script} executed.")
+            log.info("🟢 SUCCESS: %s executed.", sql_script)
         else:
-            log.error(f"🔴 FAILED: {sql_script} not executed.")
+            log.error("🔴 FAILED: %s not executed.", sql_script)
 
         return success
 
     except Exception as e:  # pylint: disable-broad-except
-        log.error(f"🔴 ERROR: {e}", exc_info=True)
+        log.error("🔴 ERROR: %s", e, exc_info=True)
 
 
 def drop_pg_role(database: str, use_default: bool) -> bool:
@@ -114,9 +110,8 @@ def drop_pg_role(database: str, use_default: bool) -> bool:
     success = False
 
     try:
-        path = f"{DESTINATION_PATH}\\db_role__DROP.sql"
-        index = path.rfind('\\')+1
-        sql_script = path[index:].strip()
+        path = DESTINATION_PATH / "db_role__DROP.sql"
+        sql_script = path.name
 
         # drop role
         success = q.pg_query_from_file(
@@ -126,14 +121,14 @@ def drop_pg_role(database: str, use_default: bool) -> bool:
         )
 
         if success:
-            log.info(f"🟢 SUCCESS: {sql_script} executed.")
+            log.info("🟢 SUCCESS: %s executed.", sql_script)
         else:
-            log.error(f"🔴 FAILED: {sql_script} not executed.")
+            log.error("🔴 FAILED: %s not executed.", sql_script)
 
         return success
 
     except Exception as e:
-        log.error(f"🔴 FAILED: {config("DB_ROLE")} was not dropped.")
+        log.error("🔴 FAILED: %s was not dropped.", DB_ROLE)
         log.error(e, exc_info=True)
 
 
@@ -160,9 +155,8 @@ def create_pg_database(database: str) -> bool:
     success = False
 
     try:
-        path = f"{DESTINATION_PATH}\\db_database__CREATE.sql"
-        index = path.rfind('\\')+1
-        sql_script = path[index:].strip()
+        path = DESTINATION_PATH / "db_database__CREATE.sql"
+        sql_script = path.name
 
         # create database
         success = q.pg_query_from_file(
@@ -172,14 +166,14 @@ def create_pg_database(database: str) -> bool:
         )
 
         if success:
-            log.info(f"🟢 SUCCESS: {sql_script} executed.")
+            log.info("🟢 SUCCESS: %s executed.", sql_script)
         else:
-            log.error(f"🔴 FAILED: {sql_script} not executed.")
+            log.error("🔴 FAILED: %s not executed.", sql_script)
 
         return success
 
     except Exception as e:  # pylint: disable-broad-except
-        log.error(f"🔴 ERROR: {e}", exc_info=True)
+        log.error("🔴 ERROR: %s", e, exc_info=True)
 
 
 def create_pg_role(database: str) -> bool:
@@ -205,9 +199,8 @@ def create_pg_role(database: str) -> bool:
     success = False
 
     try:
-        path = f"{DESTINATION_PATH}\\db_role__CREATE.sql"
-        index = path.rfind('\\')+1
-        sql_script = path[index:].strip()
+        path = DESTINATION_PATH / "db_role__CREATE.sql"
+        sql_script = path.name
 
         # create role
         if "_test" not in database:
@@ -218,14 +211,14 @@ def create_pg_role(database: str) -> bool:
             )
 
         if success:
-            log.info(f"🟢 SUCCESS: {sql_script} executed.")
+            log.info("🟢 SUCCESS: %s executed.", sql_script)
         else:
-            log.error(f"🔴 FAILED: {sql_script} not executed.")
+            log.error("🔴 FAILED: %s not executed.", sql_script)
 
         return success
 
     except Exception as e:  # pylint: disable-broad-except
-        log.error(f"🔴 FAILED: {database} was not dropped.")
+        log.error("🔴 FAILED: %s was not dropped.", database)
         log.error(e, exc_info=True)
 
 
@@ -251,9 +244,8 @@ def grant_pg_database_permissions(database: str) -> bool:
     success = False
 
     try:
-        path = f"{DESTINATION_PATH}\\db_database__GRANT.sql"
-        index = path.rfind('\\')+1
-        sql_script = path[index:].strip()
+        path = DESTINATION_PATH / "db_database__GRANT.sql"
+        sql_script = path.name
 
         # grant database permissions
         success = q.pg_query_from_file(
@@ -263,9 +255,9 @@ def grant_pg_database_permissions(database: str) -> bool:
         )
 
         if success:
-            log.info(f"🟢 SUCCESS: {sql_script} executed.")
+            log.info("🟢 SUCCESS: %s executed.", sql_script)
         else:
-            log.error(f"🔴 FAILED: {sql_script} not executed.")
+            log.error("🔴 FAILED: %s not executed.", sql_script)
 
         return success
 
@@ -296,9 +288,8 @@ def create_pg_database_schemas(database: str):
 
     success = False
     try:
-        path = f"{DESTINATION_PATH}\\db_schemas__CREATE.sql"
-        index = path.rfind('\\')+1
-        sql_script = path[index:].strip()
+        path = DESTINATION_PATH / "db_schemas__CREATE.sql"
+        sql_script = path.name
 
         # create database schemas
         success = q.pg_query_from_file(
@@ -308,9 +299,9 @@ def create_pg_database_schemas(database: str):
         )
 
         if success:
-            log.info(f"🟢 SUCCESS: {sql_script} executed.")
+            log.info("🟢 SUCCESS: %s executed.", sql_script)
         else:
-            log.error(f"🔴 FAILED: {sql_script} not executed.")
+            log.error("🔴 FAILED: %s not executed.", sql_script)
 
         return success
 
@@ -339,9 +330,8 @@ def grant_pg_table_permissions(database: str) -> bool:
 
     success = False
     try:
-        path = f"{DESTINATION_PATH}\\db_role__GRANT.sql"
-        index = path.rfind('\\')+1
-        sql_script = path[index:].strip()
+        path = DESTINATION_PATH / "db_role__GRANT.sql"
+        sql_script = path.name
 
         # grant permissions on database tables and schemas
         success = q.pg_query_from_file(
@@ -351,9 +341,9 @@ def grant_pg_table_permissions(database: str) -> bool:
         )
 
         if success:
-            log.info(f"🟢 SUCCESS: {sql_script} executed.")
+            log.info("🟢 SUCCESS: %s executed.", sql_script)
         else:
-            log.error(f"🔴 FAILED: {sql_script} not executed.")
+            log.error("🔴 FAILED: %s not executed.", sql_script)
 
         return success
 
@@ -386,7 +376,9 @@ def create_pg_tables(database: str, file: str) -> bool:
     Notes:
     ------
     - Reads table creation scripts from DESTINATION_PATH.
-    - Uses db.set_pg_connection and q.pg_query for execution.
+    - Sends all scripts in a single round trip over one connection via
+      db.set_pg_connection and q.pg_query; a failing script rolls back the
+      whole batch.
     - Logs success or failure for each table script.
     """
 
@@ -396,27 +388,34 @@ def create_pg_tables(database: str, file: str) -> bool:
         success, queries = fh.read_json_file("Destination Mapping", file)
 
         if queries[1]:
+            scripts: list = []
+            batch: list = []
 
             for table in queries:
                 item = table['destination_query_create']
-                path = f"{DESTINATION_PATH}\\{item}"
-                index = path.rfind('\\')+1
-                sql_script = path[index:].strip()
+                path = DESTINATION_PATH / item
+                sql_script = path.name
 
                 success, query = fh.read_query_from_file(path)
 
                 if not success:
-                    log.error(f"🔴 ERROR: {sql_script} is empty.")
+                    log.error("🔴 ERROR: %s is empty.", sql_script)
                     raise FileNotFoundError
 
-                conn = db.set_pg_connection(database, use_default=False)
+                scripts.append(sql_script)
+                batch.append(query)
+
+            # execute all create table scripts as one multi-statement batch
+            # over a single connection; the batch runs as one transaction
+            conn = db.set_pg_connection(database, use_default=False)
 
-                success = q.pg_query(conn, database, query)
+            success = q.pg_query(conn, database, "\n".join(batch))
 
-                if success:
-                    log.info(f"🟢 SUCCESS: {sql_script} executed.")
-                else:
-                    log.error(f"🔴 FAILED: {sql_script} not executed.")
+            if success:
+                for sql_script in scripts:
+                    log.info("🟢 SUCCESS: %s executed.", sql_script)
+            else:
+                log.error("🔴 FAILED: %s table scripts not run.", len(scripts))
 
         return success
 
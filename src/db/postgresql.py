@@ -11,7 +11,6 @@ Key Features:
 - Supports autocommit mode for transactional consistency
 
 Environment Variables Required:
-- SQL_PATH: Base path for SQL-related operations
 - POSTGRES_DB_NAME: Default database name
 - POSTGRESQL_HOSTNAME: Hostname of the PostgreSQL server
 - POSTGRESQL_PORT: Port number for the PostgreSQL server
@@ -35,7 +34,11 @@ from decouple import config
 from utils.logging_handler import logger as log
 
 
-DESTINATION_PATH = f"{config("SQL_PATH")}\\destination"
+POSTGRES_DB_NAME = config("POSTGRES_DB_NAME")
+POSTGRESQL_HOSTNAME = config("POSTGRESQL_HOSTNAME")
+POSTGRESQL_PORT = config("POSTGRESQL_PORT")
+POSTGRES_DB_USERNAME = config("POSTGRES_DB_USERNAME")
+POSTGRES_DB_PASSWORD = config("POSTGRES_DB_PASSWORD")
 
 
 def set_pg_connection(database: str, use_default: bool = False):
@@ -78,21 +81,21 @@ def set_pg_connection(database: str, use_default: bool = False):
     try:
         db: str = None
         if use_default:
-            db = config("POSTGRES_DB_NAME")
+            db = POSTGRES_DB_NAME
         else:
             db = database
 
         conn = connect(
-            host=config("POSTGRESQL_HOSTNAME"),
-            port=config("POSTGRESQL_PORT"),
+            host=POSTGRESQL_HOSTNAME,
+            port=POSTGRESQL_PORT,
             database=db,
-            user=config("POSTGRES_DB_USERNAME"),
-            password=config("POSTGRES_DB_PASSWORD"),
+            user=POSTGRES_DB_USERNAME,
+            password=POSTGRES_DB_PASSWORD,
         )
         conn.autocommit = True
 
     except OperationalError as error:
-        log.error(f"🔴 ERROR: {error}", exc_info=True)
+        log.error("🔴 ERROR: %s", error, exc_info=True)
         if "password authentication failed" in str(error):
             print("Check your username and password.")
         elif "connection refused" in str(error):
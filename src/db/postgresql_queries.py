@@ -1,15 +1,38 @@
+import io
+import re
+from decimal import Decimal
+from pathlib import Path
 from string import Template
 from decouple import config
 from psycopg2 import Error, IntegrityError, OperationalError
-from psycopg2.extras import execute_batch
 
 import db.postgresql as db
 import utils.file_handler as fh
+from utils.config_handler import ETL_UNSAFE_FAST
 from utils.logging_handler import logger as log
 
 
-def pg_query(
-        conn, database: str, query: str, values: list = []) -> bool:
+# target table and column list of an `INSERT INTO schema.table (...)` query
+INSERT_TARGET = re.compile(r"INSERT\s+INTO\s+([\w.\"]+)\s*\(([^)]*)\)", re.I)
+
+# characters that must be backslash-escaped in COPY text format
+COPY_ESCAPES = str.maketrans({
+    "\\": "\\\\",
+    "\t": "\\t",
+    "\n": "\\n",
+    "\r": "\\r",
+})
+
+# session settings for disposable bulk loads, enabled by ETL_UNSAFE_FAST
+UNSAFE_FAST_SETTINGS = (
+    "SET synchronous_commit = OFF; SET client_min_messages = WARNING;"
+)
+
+# column value types whose text form never needs COPY escaping
+COPY_NUMERIC_TYPES = (int, float, Decimal)
+
+
+def pg_query(conn, database: str, query: str) -> bool:
     """
     """
     success: bool = False
@@ -23,14 +46,8 @@ def pg_query(
     cursor = conn.cursor()
 
     try:
-
-        if values:
-            # execute insert query if values list injected
-            execute_batch(cursor, query, values, page_size=100)
-
-        else:
-            # execute other queries if no values list injected
-            cursor.execute(query)
+        # execute query; rows are bulk loaded with pg_copy instead
+        cursor.execute(query)
 
         if "$password" in query:
             query = Template(query).substitute(
@@ -69,7 +86,7 @@ def pg_query(
 
 
 def pg_query_from_file(
-        path: str, database: str, use_default: bool) -> bool:
+        path: str | Path, database: str, use_default: bool) -> bool:
     """
     """
 
@@ -96,3 +113,271 @@ def pg_query_from_file(
 
     except Exception as e:  # pylint: disable=broad-except
         log.error(e, exc_info=True)
+
+
+def copy_statement_from_insert(query: str) -> str:
+    """
+    Derives a COPY FROM STDIN statement from a parameterized INSERT query.
+
+    Parameters:
+    ----------
+    query : str
+        INSERT query of the form `INSERT INTO schema.table (col, ...) ...`.
+
+    Returns:
+    -------
+    str
+        `COPY schema.table (col, ...) FROM STDIN` statement.
+
+    Raises:
+    ------
+    ValueError
+        If the target table and column list cannot be parsed.
+    """
+
+    match = INSERT_TARGET.search(query)
+
+    if match is None:
+        raise ValueError(f"Unable to parse INSERT target from: {query}")
+
+    table, columns = match.groups()
+    columns = ", ".join(column.strip() for column in columns.split(","))
+
+    return f"COPY {table} ({columns}) FROM STDIN"
+
+
+def copy_value(value) -> str:
+    """
+    Encodes a single Python value as a PostgreSQL COPY text-format field.
+
+    Parameters:
+    ----------
+    value : Any
+        Value returned by the source query.
+
+    Returns:
+    -------
+    str
+        `\\N` for NULL, `t`/`f` for booleans, hex-escaped bytea for binary
+        values, otherwise the escaped string representation.
+    """
+
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\\\x" + bytes(value).hex()
+
+    return str(value).translate(COPY_ESCAPES)
+
+
+def copy_line(row) -> str:
+    """
+    Encodes a row as a single PostgreSQL COPY text-format line.
+
+    Parameters:
+    ----------
+    row : Sequence
+        Column values of the row.
+
+    Returns:
+    -------
+    str
+        Tab-separated, newline-terminated COPY line.
+    """
+
+    return "\t".join(map(copy_value, row)) + "\n"
+
+
+def copy_column(values) -> list:
+    """
+    Encodes one column of values as PostgreSQL COPY text-format fields.
+
+    The encoder is chosen once per column from the type of its first non-NULL
+    value instead of being dispatched per value: numeric columns skip
+    escaping, text columns only escape, and any other type falls back to
+    `copy_value`. Values whose type is not exactly the column's type, such as
+    NULLs or mixed-type values, are always encoded by `copy_value`.
+
+    Parameters:
+    ----------
+    values : Sequence
+        Values of a single column, one per row.
+
+    Returns:
+    -------
+    list
+        Encoded fields in row order.
+    """
+
+    kind = next((type(value) for value in values if value is not None), None)
+
+    if kind in COPY_NUMERIC_TYPES:
+        return [
+            str(value) if type(value) is kind else copy_value(value)
+            for value in values
+        ]
+    if kind is str:
+        return [
+            value.translate(COPY_ESCAPES) if type(value) is str
+            else copy_value(value)
+            for value in values
+        ]
+
+    return list(map(copy_value, values))
+
+
+def copy_text(values) -> str:
+    """
+    Encodes rows into a complete PostgreSQL COPY text-format payload.
+
+    Rows are transposed and encoded column by column with `copy_column`, and
+    the encoded columns are then joined back into lines. The payload can be
+    passed to `pg_copy` any number of times, so rows that are loaded into
+    more than one database are only encoded once.
+
+    Parameters:
+    ----------
+    values : Iterable
+        Rows to be encoded, each row a sequence of column values.
+
+    Returns:
+    -------
+    str
+        COPY text payload containing one line per row.
+    """
+
+    rows = values if isinstance(values, list) else list(values)
+
+    if not rows:
+        return ""
+
+    columns = [copy_column(column) for column in zip(*rows)]
+
+    return "\n".join(map("\t".join, zip(*columns))) + "\n"
+
+
+class CopyStream(io.TextIOBase):
+    """
+    Read-only file-like object that encodes rows into COPY text on demand.
+
+    Rows are pulled from the wrapped iterable only as `copy_expert` reads
+    from the stream, so a generator of source rows can be loaded without
+    materializing the full result set or its encoded text in memory.
+
+    Parameters:
+    ----------
+    rows : Iterable
+        Rows to be loaded, each row a sequence of column values.
+    """
+
+    def __init__(self, rows):
+        self._lines = map(copy_line, rows)
+        self._pending = ""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> str:
+        chunks: list = [self._pending]
+        length = len(self._pending)
+
+        # encode rows until the requested number of characters is buffered
+        while size < 0 or length < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            chunks.append(line)
+            length += len(line)
+
+        data = "".join(chunks)
+
+        if size < 0:
+            size = length
+
+        self._pending = data[size:]
+
+        return data[:size]
+
+
+def pg_copy(conn, database: str, query: str, values) -> bool:
+    """
+    Bulk loads rows into a PostgreSQL table using COPY FROM STDIN.
+
+    The target table and columns are taken from the parameterized INSERT
+    query, so existing INSERT query files can be reused unchanged. COPY
+    writes identity column values as provided, matching the INSERT queries'
+    `OVERRIDING SYSTEM VALUE` clause. When ETL_UNSAFE_FAST is enabled the
+    load session does not wait for its commit to be flushed to disk.
+
+    Parameters:
+    ----------
+    conn : psycopg2.extensions.connection or None
+        Existing connection; a new one is created if None.
+    database : str
+        Target database name.
+    query : str
+        Parameterized INSERT query for the target table.
+    values : Iterable or str
+        Rows to be loaded, each row a sequence of column values. Rows are
+        encoded lazily, so a generator of source rows is streamed straight
+        through to the server. A payload already encoded by `copy_text` is
+        sent as is.
+
+    Returns:
+    -------
+    bool
+        True if the rows were copied and committed successfully.
+    """
+    success: bool = False
+
+    if conn is None:
+        conn = db.set_pg_connection(database)
+
+    # create cursor
+    cursor = conn.cursor()
+
+    try:
+        # reuse pre-encoded copy text, otherwise encode rows on demand
+        if isinstance(values, str):
+            stream = io.StringIO(values)
+        else:
+            stream = CopyStream(values)
+
+        # skip the commit fsync for rebuilds that can simply be re-run
+        if ETL_UNSAFE_FAST:
+            cursor.execute(UNSAFE_FAST_SETTINGS)
+
+        # stream all rows to the server in a single COPY operation
+        cursor.copy_expert(copy_statement_from_insert(query), stream)
+
+        success = True
+        conn.commit()
+
+        return success
+
+    except IntegrityError as error:
+        if conn:
+            conn.rollback()
+        log.error(error, exc_info=True)
+
+    except OperationalError as error:
+        if conn:
+            conn.rollback()
+        log.error(error, exc_info=True)
+
+    except Error as error:
+        if conn:
+            conn.rollback()
+        log.error(error, exc_info=True)
+
+    except Exception as e:
+        if conn:
+            conn.rollback()
+        log.error(e, exc_info=True)
+
+    finally:
+        if conn:
+            cursor.close()
+            conn.close()
@@ -11,6 +11,8 @@ Key Features:
 -------------
 - Dynamically establishes a SQL Server connection if none is provided
 - Executes arbitrary SQL queries and returns results as a list of lists
+- Streams query results row by row for bulk transfer without materializing
+  the full result set
 - Handles database errors with rollback and structured logging
 - Ensures connection closure and transactional integrity
 
@@ -31,13 +33,16 @@ Example Usage:
         # Process results
 """
 
-from typing import Tuple
+from typing import Iterator, Tuple
 from decouple import config
 from pyodbc import connect, DatabaseError, Error
 
 from utils.logging_handler import logger as log
 
 
+SQLSERVER_CONN = config("SQLSERVER_CONN")
+
+
 def execute_sql_query(conn, query: str = None) -> Tuple[bool, list]:
     """
     Executes a SQL query against a SQL Server database using pyodbc.
@@ -87,12 +92,12 @@ def execute_sql_query(conn, query: str = None) -> Tuple[bool, list]:
     """
 
     success: bool = False
-    rows: list = list()
-    data: list = list()
+    rows: list = []
+    data: list = []
 
     try:
         if conn is None:
-            conn = connect(config("SQLSERVER_CONN"))
+            conn = connect(SQLSERVER_CONN)
 
         cursor = conn.cursor()
         cursor.execute(query)
@@ -112,14 +117,84 @@ def execute_sql_query(conn, query: str = None) -> Tuple[bool, list]:
     except DatabaseError as error:
         if conn:
             conn.rollback()
-            log.error(f"🔴 ERROR: Query {query}, {error}",
+            log.error("🔴 ERROR: Query %s, %s", query, error,
+                      exc_info=True)
+
+    except Error as error:
+        if conn:
+            conn.rollback()
+            log.error("🔴 ERROR: %s", error,
+                      exc_info=True)
+
+    finally:
+        if conn:
+            conn.close()
+
+
+def iter_sql_query(
+        conn, query: str = None, batch_size: int = 1000) -> Iterator[tuple]:
+    """
+    Executes a SQL query against SQL Server and yields rows as they arrive.
+
+    Parameters:
+    ----------
+    conn : pyodbc.Connection or None
+        An existing database connection. If None, a new connection is created
+        using the environment variable `SQLSERVER_CONN`.
+    query : str, optional
+        The SQL query string to execute. Defaults to None.
+    batch_size : int, optional
+        Number of rows fetched from the server per round trip. Defaults to
+        1000.
+
+    Yields:
+    ------
+    pyodbc.Row
+        One row of the result set at a time.
+
+    Exceptions:
+    ----------
+    DatabaseError, Error:
+        Logged and re-raised so that a consumer (e.g. a running COPY) is
+        aborted instead of committing a partial result set.
+
+    Notes:
+    ------
+    - Closes the connection once the generator is exhausted, fails, or is
+    closed by the consumer.
+    """
+
+    try:
+        if conn is None:
+            conn = connect(SQLSERVER_CONN)
+
+        cursor = conn.cursor()
+        cursor.execute(query)
+
+        while True:
+            rows = cursor.fetchmany(batch_size)
+
+            if not rows:
+                break
+
+            yield from rows
+
+        conn.commit()
+        cursor.close()
+
+    except DatabaseError as error:
+        if conn:
+            conn.rollback()
+            log.error("🔴 ERROR: Query %s, %s", query, error,
                       exc_info=True)
+        raise
 
     except Error as error:
         if conn:
             conn.rollback()
-            log.error(f"🔴 ERROR: {error}",
+            log.error("🔴 ERROR: %s", error,
                       exc_info=True)
+        raise
 
     finally:
         if conn:
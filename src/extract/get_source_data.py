@@ -4,13 +4,14 @@ Module: get_source_data
 
 This module provides functionality to extract and validate source data from
 SQL query files defined in a JSON mapping configuration. It reads query
-definitions, executes them against a SQL Server database, and returns the
-aggregated results for downstream processing.
+definitions, executes them concurrently against a SQL Server database, and
+returns the aggregated results for downstream processing.
 
 Dependencies:
 -------------
 - db.sql_server: Executes SQL queries using a default connection.
 - utils.file_handler: Handles reading of JSON and SQL files.
+- utils.config_handler: Provides the source query path.
 - utils.logging_handler: Provides structured logging.
 - utils.validation_handler: Validates data structures post-query execution.
 - decouple.config: Loads environment-specific configuration values.
@@ -18,6 +19,8 @@ Dependencies:
 Environment Variables:
 ----------------------
 - SQL_PATH: Base path to the directory containing SQL source query files.
+- SOURCE_MAX_WORKERS: Maximum number of source queries executed concurrently
+  (optional, defaults to 8).
 
 Usage:
 ------
@@ -31,16 +34,19 @@ Example:
         process(data)
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Tuple
 from decouple import config
 
 import db.sql_server as sqldb
 import utils.file_handler as fh
+from utils.config_handler import SOURCE_PATH
 from utils.logging_handler import logger as log
 import utils.validation_handler as vh
 
 
-SOURCE_PATH = f"{config("SQL_PATH")}\\source"
+SOURCE_MAX_WORKERS = config("SOURCE_MAX_WORKERS", default=8, cast=int)
 
 
 def get_source_data(file: str = None) -> Tuple[bool, list]:
@@ -49,9 +55,10 @@ def get_source_data(file: str = None) -> Tuple[bool, list]:
     mapping file.
 
     This function reads a JSON file containing metadata about source tables
-    and their associated SQL query filenames. It loads each query, executes it
-    using the default SQL Server connection, and aggregates the results into a
-    list. Each query result is validated before inclusion.
+    and their associated SQL query filenames. It loads each query, executes
+    the queries concurrently (one SQL Server connection per worker thread, up
+    to SOURCE_MAX_WORKERS), and aggregates the results into a list in mapping
+    order. Each query result is validated before inclusion.
 
     Parameters:
     -----------
@@ -86,36 +93,55 @@ def get_source_data(file: str = None) -> Tuple[bool, list]:
     success = False
 
     # instantiate data list variable to be returned
-    data: list = list()
+    data: list = []
 
     try:
         # read mapping_source.json file
         success, queries = fh.read_json_file("Mapping Source", file)
-        queries.sort(key=lambda x: int(x['table_id']))
+        queries = sorted(queries, key=itemgetter('table_id'))
         # test if queries is not empty
         if success:
 
+            scripts: list = []
+            batch: list = []
+
             for table in queries:
 
                 # construct full path to source query file
                 item = table['source_query_select']
-                path = f"{SOURCE_PATH}\\{item}"
-                index = path.rfind('\\')+1
+                path = SOURCE_PATH / item
 
                 # read query from file
                 success, query = fh.read_query_from_file(path)
 
                 # handle empty/missing query file
                 if not success:
-                    log.error(f"🔴 FAILED: {path[index:].strip()} does not \
-                              return a query.")
+                    log.error(
+                        "🔴 FAILED: %s does not return a query.",
+                        path.name
+                    )
                     raise FileNotFoundError
 
-                # execute query using default postgres connection
-                success, response = sqldb.execute_sql_query(
-                    conn=None,
-                    query=query
-                )
+                scripts.append(path.name)
+                batch.append(query)
+
+            # execute independent select queries concurrently; each call
+            # opens its own connection and map() preserves mapping order
+            workers = max(1, min(len(batch), SOURCE_MAX_WORKERS))
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(
+                    lambda query: sqldb.execute_sql_query(
+                        conn=None,
+                        query=query
+                    ),
+                    batch
+                ))
+
+            for sql_script, result in zip(scripts, results):
+
+                # a failed query returns None instead of a result tuple
+                success, response = result or (False, None)
 
                 if success:
                     # add query result to data list
@@ -125,9 +151,9 @@ def get_source_data(file: str = None) -> Tuple[bool, list]:
                 success = vh.validate_list("Source Data", data)
 
                 if success:
-                    log.info(f"🟢 SUCCESS: {path[index:]} executed.")
+                    log.info("🟢 SUCCESS: %s executed.", sql_script)
                 else:
-                    log.error(f"🔴 FAILED: {path[index:]} not executed.")
+                    log.error("🔴 FAILED: %s not executed.", sql_script)
 
             # return success bool and data list containing source data
             return success, data
@@ -4,20 +4,26 @@ Module: insert_source_data
 
 This module handles the insertion of structured data into PostgreSQL tables
 using parameterized SQL queries defined in a JSON mapping file. It reads query
-templates, binds data values, and executes inserts against a target database.
+templates, derives the target table and columns from them, and bulk loads the
+data values with COPY FROM STDIN against a target database. Source rows can
+also be streamed straight from SQL Server into the destination tables without
+being held in memory, or encoded once into COPY payloads that are reused for
+every database they are loaded into.
 
 Dependencies:
 -------------
 - db.postgresql: Manages PostgreSQL connection setup.
-- db.postgresql_queries: Executes parameterized SQL insert operations.
+- db.postgresql_queries: Executes COPY bulk load operations.
+- db.sql_server: Streams source query results from SQL Server.
 - utils.file_handler: Loads JSON mappings and reads SQL query files.
 - utils.logging_handler: Provides structured logging for success and error
 tracking.
-- decouple.config: Loads environment-specific configuration values.
+- utils.config_handler: Provides the source and destination query paths.
 
 Environment Variables:
 ----------------------
-- SQL_PATH: Base path to the directory containing SQL destination query files.
+- SQL_PATH: Base path to the directory containing SQL source and destination
+query files.
 
 Usage:
 ------
@@ -36,26 +42,24 @@ Example:
         log.info("All destination inserts completed successfully.")
 """
 
-from decouple import config
+from operator import itemgetter
 
 import db.postgresql as pgdb
 import db.postgresql_queries as q
 import utils.file_handler as fh
+from utils.config_handler import DESTINATION_PATH, SOURCE_PATH
 from utils.logging_handler import logger as log
 
 
-DESTINATION_PATH = f"{config("SQL_PATH")}\\destination"
-
-
 def insert_pg_tables(database: str, file: str, data: list) -> bool:
     """
     Inserts data into PostgreSQL tables using SQL queries defined in a JSON
     mapping file.
 
     This function reads a destination mapping file that specifies table IDs
-    and associated SQL insert query filenames. It loads each query, binds the
-    corresponding data values, and executes the insert operation using a
-    PostgreSQL connection.
+    and associated SQL insert query filenames. It loads each query and streams
+    the corresponding data values to the table named by the query in a single
+    COPY FROM STDIN operation per table, avoiding a round trip per row.
 
     Parameters:
     -----------
@@ -68,13 +72,14 @@ def insert_pg_tables(database: str, file: str, data: list) -> bool:
 
     data : list
         A list of data payloads to be inserted. Each item corresponds to a
-        table ID defined in the mapping file.
+        table ID defined in the mapping file and is either a list of rows or
+        a COPY payload built by `encode_pg_tables`.
 
     Returns:
     --------
     bool
-        True if all insert operations succeed; False if any query fails or an
-        exception occurs.
+        True if all insert operations succeed; False as soon as a query file
+        cannot be read, a table fails to load or an exception occurs.
 
     Raises:
     -------
@@ -99,7 +104,7 @@ def insert_pg_tables(database: str, file: str, data: list) -> bool:
     try:
         # read mapping_destination.json file
         success, queries = fh.load_json_file(file)
-        queries.sort(key=lambda x: int(x['table_id']))
+        queries = sorted(queries, key=itemgetter('table_id'))
 
         # test if queries is not empty
         if success:
@@ -107,32 +112,178 @@ def insert_pg_tables(database: str, file: str, data: list) -> bool:
             for table in queries:
                 # construct full path to destination query file
                 item = table['destination_query_insert']
-                path = f"{DESTINATION_PATH}\\{item}"
-                index = path.rfind('\\')+1
-                data_index = int(table['table_id'])-1
+                path = DESTINATION_PATH / item
+                data_index = table['table_id']-1
                 values = data[data_index]
 
                 # read query from file
                 success, query = fh.read_query_from_file(path)
 
+                if not success:
+                    log.error(
+                        "🔴 FAILED: %s does not return a query.", path.name
+                    )
+                    return success
+
                 # set connection to postgresql database
                 conn = pgdb.set_pg_connection(database)
 
-                # execute insert query
-                q.pg_query(
+                # bulk load values into the insert query's target table
+                success = q.pg_copy(
                     conn,
                     database=database,
                     query=query,
                     values=values
                 )
 
-                # set success variable
-                success = True
-
                 if success:
-                    log.info(f"🟢 SUCCESS: {path[index:]} executed.")
+                    log.info("🟢 SUCCESS: %s executed.", path.name)
                 else:
-                    log.error(f"🔴 FAILED: {path[index:]} not executed.")
+                    log.error("🔴 FAILED: %s not executed.", path.name)
+                    return success
+
+        # return success boolean
+        return success
+
+    except FileNotFoundError as error:
+        log.error(error, exc_info=True)
+
+    except Exception as e:  # pylint: disable=broad-except
+        log.error(e, exc_info=True)
+
+
+def encode_pg_tables(data: list) -> list:
+    """
+    Encodes source data payloads into reusable COPY text payloads.
+
+    Loading the same source data into several databases would otherwise
+    encode every row once per database. The returned payloads are accepted
+    by `insert_pg_tables` in place of the row lists and can be replayed any
+    number of times.
+
+    Parameters:
+    -----------
+    data : list
+        A list of data payloads, one list of rows per source table.
+
+    Returns:
+    --------
+    list
+        A list of COPY text payloads in the same order as `data`.
+    """
+
+    return [q.copy_text(values) for values in data]
+
+
+def stream_pg_tables(
+        database: str, source_file: str, destination_file: str) -> bool:
+    """
+    Streams source tables from SQL Server directly into PostgreSQL tables.
+
+    This function pairs the source and destination mapping entries by table
+    ID and, for each table, pipes the rows of the source SELECT query straight
+    into a COPY FROM STDIN on the destination table named by the insert query.
+    Rows are fetched and encoded in small batches, so neither the source
+    result set nor its encoded form is ever held in memory as a whole.
+
+    Parameters:
+    -----------
+    database : str
+        The name of the target PostgreSQL database.
+
+    source_file : str
+        The filename of the JSON mapping file ('mapping_source.json') that
+        defines the select query files and table IDs.
+
+    destination_file : str
+        The filename of the JSON mapping file ('mapping_destination.json')
+        that defines the insert query files and table IDs.
+
+    Returns:
+    --------
+    bool
+        True if all tables were streamed successfully; False if any table
+        fails or an exception occurs.
+
+    Raises:
+    -------
+    FileNotFoundError:
+        If any referenced SQL query file is missing or unreadable.
+
+    Notes:
+    ------
+    - Tables are loaded in table ID order so that referenced tables are
+    populated before the tables that reference them.
+    - A failing source query aborts the running COPY, so no partial table
+    is committed.
+    """
+
+    # defer the SQL Server driver import until streaming is required
+    import db.sql_server as sqldb
+
+    # instantiate success boolean variable to be returned
+    success: bool = False
+
+    try:
+        # read mapping_source.json and mapping_destination.json files
+        success, sources = fh.load_json_file(source_file)
+
+        if not success:
+            return success
+
+        success, destinations = fh.load_json_file(destination_file)
+
+        if not success:
+            return success
+
+        # pair select and insert queries by table id
+        select_queries = {
+            table['table_id']: table['source_query_select']
+            for table in sources
+        }
+        destinations = sorted(destinations, key=itemgetter('table_id'))
+
+        for table in destinations:
+            table_id = table['table_id']
+            item = table['destination_query_insert']
+            sql_script = item.strip()
+
+            # read select and insert queries from file
+            success, select_query = fh.read_query_from_file(
+                SOURCE_PATH / select_queries[table_id]
+            )
+
+            if not success:
+                log.error(
+                    "🔴 FAILED: %s does not return a query.",
+                    select_queries[table_id]
+                )
+                raise FileNotFoundError
+
+            success, insert_query = fh.read_query_from_file(
+                DESTINATION_PATH / item
+            )
+
+            if not success:
+                log.error("🔴 FAILED: %s does not return a query.", sql_script)
+                raise FileNotFoundError
+
+            # set connection to postgresql database
+            conn = pgdb.set_pg_connection(database)
+
+            # pipe source rows into the insert query's target table
+            success = q.pg_copy(
+                conn,
+                database=database,
+                query=insert_query,
+                values=sqldb.iter_sql_query(conn=None, query=select_query)
+            )
+
+            if success:
+                log.info("🟢 SUCCESS: %s executed.", sql_script)
+            else:
+                log.error("🔴 FAILED: %s not executed.", sql_script)
+                return success
 
         # return success boolean
         return success
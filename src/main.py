@@ -13,7 +13,7 @@ Functions:
     - Drops and rebuilds PostgreSQL databases and roles.
     - Generates source and destination query mappings from a CSV file.
     - Extracts source data using parameterized SQL SELECT queries.
-    - Loads extracted data into destination tables using INSERT queries.
+    - Bulk loads extracted data into destination tables using COPY.
     - Optionally seeds a test database with the same data.
 
 Dependencies:
@@ -21,8 +21,8 @@ Dependencies:
     - extract.get_source_data: Source data extraction logic.
     - load.insert_source_data: Destination data insertion logic.
     - utils.query_mapping_handler: Mapping generation from CSV.
+    - utils.config_handler: Shared environment-driven paths and settings.
     - utils.logging_handler: Structured logging.
-    - decouple.config: Environment variable management.
 
 Environment Variables:
     - SQL_PATH: Root directory for query files and mapping CSV.
@@ -33,7 +33,12 @@ Execution Steps:
     2. Generate source and destination query mappings.
     3. Create databases, roles, schemas, and tables.
     4. Extract source data.
-    5. Load data into destination and optionally test database.
+    5. Load data into destination and optionally test database. When the
+       test database is not seeded, steps 4 and 5 are fused and the source
+       data is streamed directly into the destination.
+
+    The test database is built in a background thread while steps 4 and 5
+    run against the main database.
 
 Example:
     To orchestrate ETL for the `sales_db` database and seed a test database:
@@ -50,21 +55,29 @@ Example:
 """
 
 import sys
-import pandas as pd
 import argparse
-from decouple import config
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import build.build_destination_database as pgdb
-import extract.get_source_data as srcdata
 import load.insert_source_data as dest
+from utils.config_handler import (
+    DB_ROLE,
+    DESTINATION_FILE,
+    MAPPING_FILE,
+    SOURCE_FILE,
+)
 from utils.logging_handler import logger as log
 import utils.query_mapping_handler as qmh
 
 
-SQL_PATH = config("SQL_PATH")
-MAPPING_FILE = f"{SQL_PATH}\\mapping.csv"
-SOURCE_FILE = f"{SQL_PATH}\\mapping_source.json"
-DESTINATION_FILE = f"{SQL_PATH}\\mapping_destination.json"
+class ETLError(Exception):
+    """
+    Raised when a step of the ETL pipeline fails.
+
+    The orchestration helpers raise it instead of exiting the process, so
+    a failure unwinds to a single handler in the `__main__` block.
+    """
 
 
 def main(args):
@@ -84,13 +97,13 @@ def main(args):
             test clone.
 
     Raises:
-        SystemExit: If any critical step in the ETL pipeline fails.
+        ETLError: If any critical step in the ETL pipeline fails.
     """
 
     test_database = f"{args.database}_test"
 
     log.info("===============================================================")
-    log.info(f"⚫ STARTING: ETL for Database {args.database}")
+    log.info("⚫ STARTING: ETL for Database %s", args.database)
 
     log.info("🔷 DROP DATABASES")
     # drop database
@@ -103,10 +116,8 @@ def main(args):
     drop_role(args.database)
 
     log.info("🔷 BUILD QUERY/TABLE MAPPINGS")
-    # define source query/table mappings
-    build_mapping_data("source", MAPPING_FILE, SOURCE_FILE)
-    # define destination query/table mappings
-    build_mapping_data("destination", MAPPING_FILE, DESTINATION_FILE)
+    # define source and destination query/table mappings
+    build_mapping_data(MAPPING_FILE, SOURCE_FILE, DESTINATION_FILE)
 
     log.info("🔷 BUILD DATABASES")
     # build database
@@ -116,69 +127,145 @@ def main(args):
     create_database_schemas(args.database)
     grant_table_permissions(args.database)
 
+    log.info("🔷 CREATE DATABASE TABLES")
+    # create database tables
+    create_database_tables(args.database, DESTINATION_FILE)
+
+    # the test database build does not depend on the source data, so it
+    # runs in the background while the source data is extracted and loaded
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        test_build = executor.submit(build_test_database, test_database)
+
+        if not args.seed_test_database:
+            # source data is only loaded once: stream it straight from the
+            # source into the destination database without holding it in
+            # memory
+            log.info("🔷 STREAM SOURCE DATA TO DESTINATION")
+            stream_destination_tables(
+                args.database, SOURCE_FILE, DESTINATION_FILE
+            )
+        else:
+            log.info("🔷 EXTRACT SOURCE DATA")
+            # extract table data from source database
+            source_data = extract_source_data(SOURCE_FILE)
+
+            # encode source data once for both the main and test databases
+            # and release the extracted rows
+            source_data = dest.encode_pg_tables(source_data)
+
+            # load source data into destination database
+            log.info("🔷 LOAD DESTINATION DATA")
+            load_destination_tables(
+                args.database, DESTINATION_FILE, source_data
+            )
+
+        # wait for the test database; re-raises ETLError if it failed
+        test_build.result()
+
+    # load source data into destination test database
+    if args.seed_test_database:
+        load_destination_tables(test_database, DESTINATION_FILE, source_data)
+
+    log.info("🏁 COMPLETED: ETL for Database: %s.", args.database)
+    log.info("===============================================================")
+
+
+def build_test_database(test_database: str):
+    """
+    Builds the test clone of the destination database.
+
+    This function creates the test database, grants its permissions, and
+    creates its schemas and tables. It shares no data with the source
+    extraction, so `main` runs it concurrently with the extract/load phase.
+
+    Args:
+        test_database (str): Name of the PostgreSQL test database.
+
+    Raises:
+        ETLError: If any build step fails.
+    """
+
+    log.info("🔷 BUILD TEST DATABASE")
     # build test database
     create_database(test_database)
     grant_database_permissions(test_database)
     create_database_schemas(test_database)
     grant_table_permissions(test_database)
 
-    log.info("🔷 CREATE DATABASE TABLES")
-    # create database tables
-    create_database_tables(args.database, DESTINATION_FILE)
     # create test database tables
     create_database_tables(test_database, DESTINATION_FILE)
 
-    log.info("🔷 EXTRACT SOURCE DATA")
-    # extract table data from source database
-    source_data = extract_source_data(SOURCE_FILE)
 
-    # load source data into destination database
-    log.info("🔷 LOAD DESTINATION DATA")
-    load_destination_tables(args.database, DESTINATION_FILE, source_data)
+def stream_destination_tables(
+        database: str,
+        source_file: Path,
+        destination_file: Path):
+    """
+    Streams source data directly into PostgreSQL destination tables.
 
-    # load source data into destination test database
-    if args.seed_test_database:
-        load_destination_tables(test_database, DESTINATION_FILE, source_data)
+    This function delegates to `dest.stream_pg_tables`, which pipes each
+    source SELECT result into a COPY on the mapped destination table. It is
+    used when the extracted data is consumed by a single database, so the
+    rows never need to be materialized in Python.
 
-    log.info(f"🏁 COMPLETED: ETL for Database: {args.database}.")
-    log.info("===============================================================")
+    Args:
+        database (str): Name of the target PostgreSQL database.
+        source_file (Path): Path to the JSON file containing source query
+        mappings.
+        destination_file (Path): Path to the JSON file containing destination
+        query mappings.
+
+    Raises:
+        ETLError: If streaming fails via `dest.stream_pg_tables`.
+    """
+
+    log.info("➡️ STARTING: Streaming Source Data to Destination Tables")
+    # pipe source select queries into destination tables
+    success = dest.stream_pg_tables(database, source_file, destination_file)
+
+    if not success:
+        raise ETLError("⛓️‍💥 EXITING: Destination Tables not loaded.")
+
+    log.info("☑️ COMPLETED: Destination Tables loaded.")
+    log.info("---------------------------------------------------------------")
 
 
 def load_destination_tables(
         database: str,
-        destination_file: str,
-        source_data: str):
+        destination_file: Path,
+        source_data: list):
     """
     Loads source data into PostgreSQL destination tables using predefined
     query mappings.
 
-    This function delegates the insertion logic to `dest.insert_pg_tables`,
-    which executes the mapped SQL insert statements defined in the destination
-    file. It logs the start and completion of the process, and exits the
-    program if the insertion fails.
+    This function delegates the load to `dest.insert_pg_tables`, which bulk
+    loads each table with COPY FROM STDIN into the target named by the mapped
+    SQL insert query in the destination file. It logs the start and
+    completion of the process, and raises ETLError if the load fails.
 
     Args:
         database (str): Name of the target PostgreSQL database.
-        destination_file (str): Path to the JSON file containing destination
+        destination_file (Path): Path to the JSON file containing destination
         query mappings.
-        source_data (str): Serialized source data payload to be inserted.
+        source_data (list): Source data payloads to be inserted, either row
+        lists or COPY payloads built by `dest.encode_pg_tables`.
 
     Raises:
-        SystemExit: If the data insertion fails via `dest.insert_pg_tables`.
+        ETLError: If the data insertion fails via `dest.insert_pg_tables`.
     """
 
     log.info("➡️ STARTING: Loading Destination Tables")
-    # execute insert queries to insert source data
+    # bulk load source data into the insert queries' target tables
     success = dest.insert_pg_tables(database, destination_file, source_data)
 
     if not success:
-        sys.exit("⛓️‍💥 EXITING: Destination Tables not loaded.")
+        raise ETLError("⛓️‍💥 EXITING: Destination Tables not loaded.")
 
     log.info("☑️ COMPLETED: Destination Tables loaded.")
     log.info("---------------------------------------------------------------")
 
 
-def extract_source_data(source_file: str) -> list:
+def extract_source_data(source_file: Path) -> list:
     """
     Extracts source data using SQL SELECT queries defined in a JSON mapping
     file.
@@ -187,23 +274,26 @@ def extract_source_data(source_file: str) -> list:
     mapped SQL SELECT statements, and returns the resulting data payloads.
 
     Args:
-        source_file (str): Path to the JSON file containing source query
+        source_file (Path): Path to the JSON file containing source query
         mappings.
 
     Returns:
         list: A list of extracted data payloads.
 
     Raises:
-        SystemExit: If no data is returned from the source queries.
+        ETLError: If no data is returned from the source queries.
     """
 
+    # defer the SQL Server driver import until extraction is required
+    import extract.get_source_data as srcdata
+
     # get source data
     log.info("➡️ STARTING: Extracting Source Data")
     # execute select queries to get source data
     success, source_data = srcdata.get_source_data(source_file)
 
     if not success:
-        sys.exit("⛓️‍💥 EXITING: No source data returned.")
+        raise ETLError("⛓️‍💥 EXITING: No source data returned.")
 
     log.info("☑️ COMPLETED: Source Data extracted.")
     log.info("---------------------------------------------------------------")
@@ -211,7 +301,7 @@ def extract_source_data(source_file: str) -> list:
     return source_data
 
 
-def create_database_tables(database: str, destination_file: str):
+def create_database_tables(database: str, destination_file: Path):
     """
     Creates PostgreSQL tables using destination query definitions.
 
@@ -221,22 +311,22 @@ def create_database_tables(database: str, destination_file: str):
 
     Args:
         database (str): Name of the target PostgreSQL database.
-        destination_file (str): Path to the JSON file containing table
+        destination_file (Path): Path to the JSON file containing table
         creation queries.
 
     Raises:
-        SystemExit: If table creation fails due to invalid queries or
+        ETLError: If table creation fails due to invalid queries or
         connection issues.
     """
 
     # database: execute create table queries
-    log.info(f"➡️ STARTING: Creating {database} Tables.")
+    log.info("➡️ STARTING: Creating %s Tables.", database)
     success = pgdb.create_pg_tables(database, destination_file)
 
     if not success:
-        sys.exit(f"⛓️‍💥 EXITING: {database} Tables not created.")
+        raise ETLError(f"⛓️‍💥 EXITING: {database} Tables not created.")
 
-    log.info(f"☑️ COMPLETED: {database} Tables created.")
+    log.info("☑️ COMPLETED: %s Tables created.", database)
     log.info("---------------------------------------------------------------")
 
 
@@ -254,7 +344,7 @@ def grant_table_permissions(database) -> bool:
         bool: True if permissions are granted successfully.
 
     Raises:
-        SystemExit: If permission grant fails due to invalid configuration or
+        ETLError: If permission grant fails due to invalid configuration or
         execution error.
     """
 
@@ -263,7 +353,7 @@ def grant_table_permissions(database) -> bool:
     success = pgdb.grant_pg_table_permissions(database)
 
     if not success:
-        sys.exit("⛓️‍💥 EXITING: Table Permissions not granted.")
+        raise ETLError("⛓️‍💥 EXITING: Table Permissions not granted.")
 
     log.info("☑️ COMPLETED: Table Permissions granted.")
     log.info("---------------------------------------------------------------")
@@ -283,7 +373,7 @@ def create_database_schemas(database) -> bool:
         bool: True if schemas are created successfully.
 
     Raises:
-        SystemExit: If schema creation fails due to execution errors or
+        ETLError: If schema creation fails due to execution errors or
         invalid configuration.
     """
     # grant database permissions
@@ -291,7 +381,7 @@ def create_database_schemas(database) -> bool:
     success = pgdb.create_pg_database_schemas(database)
 
     if not success:
-        sys.exit("⛓️‍💥 EXITING: Database Schemas not created.")
+        raise ETLError("⛓️‍💥 EXITING: Database Schemas not created.")
 
     log.info("☑️ COMPLETED: Database Schemas created.")
     log.info("---------------------------------------------------------------")
@@ -312,7 +402,7 @@ def grant_database_permissions(database) -> bool:
         bool: True if permissions are granted successfully.
 
     Raises:
-        SystemExit: If permission grant fails due to configuration or
+        ETLError: If permission grant fails due to configuration or
         execution errors.
     """
 
@@ -321,7 +411,7 @@ def grant_database_permissions(database) -> bool:
     success = pgdb.grant_pg_database_permissions(database)
 
     if not success:
-        sys.exit("⛓️‍💥 EXITING: Database Permissions not granted.")
+        raise ETLError("⛓️‍💥 EXITING: Database Permissions not granted.")
 
     log.info("☑️ COMPLETED: Database Permissions granted.")
     log.info("---------------------------------------------------------------")
@@ -338,18 +428,18 @@ def create_role(database: str):
         database (str): Name of the target PostgreSQL database.
 
     Raises:
-        SystemExit: If role creation fails due to execution errors or invalid
+        ETLError: If role creation fails due to execution errors or invalid
         configuration.
     """
 
     # create role
-    log.info(f"➡️ STARTING: Creating Role {config("DB_ROLE")}")
+    log.info("➡️ STARTING: Creating Role %s", DB_ROLE)
     success = pgdb.create_pg_role(database)
 
     if not success:
-        sys.exit("⛓️‍💥 EXITING: Role not created.")
+        raise ETLError("⛓️‍💥 EXITING: Role not created.")
 
-    log.info(f"☑️ COMPLETED: Role {config("DB_ROLE")} created.")
+    log.info("☑️ COMPLETED: Role %s created.", DB_ROLE)
     log.info("---------------------------------------------------------------")
 
 
@@ -364,67 +454,67 @@ def create_database(database: str):
         database (str): Name of the database to create.
 
     Raises:
-        SystemExit: If database creation fails due to execution errors or
+        ETLError: If database creation fails due to execution errors or
         invalid configuration.
     """
 
     # create database
-    log.info(f"➡️ STARTING: Creating Database {database}.")
+    log.info("➡️ STARTING: Creating Database %s.", database)
     success = pgdb.create_pg_database(database)
 
     if not success:
-        sys.exit("⛓️‍💥 EXITING: Database not created.")
+        raise ETLError("⛓️‍💥 EXITING: Database not created.")
 
-    log.info(f"☑️ COMPLETED: Database {database} created.")
+    log.info("☑️ COMPLETED: Database %s created.", database)
     log.info("---------------------------------------------------------------")
 
 
-def build_mapping_data(mapping_type: str, mapping_file: str, output_file: str):
+def build_mapping_data(
+        mapping_file: Path, source_file: Path, destination_file: Path):
     """
-    Generates query or table mappings from a CSV file and writes the result to
-    a JSON file.
+    Generates source and destination query/table mappings from a CSV file and
+    writes each result to a JSON file.
 
-    This function parses a CSV file containing table or query mappings and
-    serializes the structured output to a JSON file. The mapping type
-    determines whether the mappings are for source extraction or destination
-    loading.
+    This function parses the CSV file containing table and query mappings
+    once and serializes the source extraction and destination loading
+    mappings to their respective JSON files. Both JSON files are left as
+    they are when they are already newer than the CSV file.
 
     Args:
-        mapping_type (str): Type of mapping to generate; must be either
-        'source' or 'destination'.
-        mapping_file (str): Path to the CSV file containing table/query
+        mapping_file (Path): Path to the CSV file containing table/query
         mappings.
-        output_file (str): Path to the output JSON file where mappings will be
-        written.
+        source_file (Path): Path to the output JSON file where source
+        mappings will be written.
+        destination_file (Path): Path to the output JSON file where
+        destination mappings will be written.
 
     Raises:
-        SystemExit: If mapping generation fails due to invalid input or write
+        ETLError: If mapping generation fails due to invalid input or write
         errors.
     """
 
     success = False
-    mapping = pd.DataFrame()
-    log.info(
-        f"➡️ STARTING: Building {mapping_type.title()} Query/Table Mapping."
-    )
-
-    match mapping_type:
-        case "source":
-            mapping = qmh.get_source_mapping_data(mapping_file)
-        case "destination":
-            mapping = qmh.get_destination_mapping_data(mapping_file)
-        case _:
-            log.error(f"FAILED: {mapping_type.title()} mapping not defined.")
-
-    if not mapping.empty:
-        success = qmh.write_mapping_data(mapping, output_file)
+    log.info("➡️ STARTING: Building Query/Table Mappings.")
+
+    # the json mappings only change when the csv file does
+    if qmh.mapping_data_is_current(
+            mapping_file, source_file, destination_file):
+        success = True
+        log.info("🟢 SUCCESS: Query/Table Mappings are up to date.")
+    else:
+        # read source and destination mappings in one pass over the csv file
+        source, destination = qmh.get_mapping_data(mapping_file)
+
+        if source and destination:
+            success = (
+                qmh.write_mapping_data(source, source_file)
+                and qmh.write_mapping_data(destination, destination_file)
+            )
 
     if not success:
-        sys.exit("⛓️‍💥 EXITING: Query/Table Mapping failed.")
+        raise ETLError("⛓️‍💥 EXITING: Query/Table Mapping failed.")
 
-    log.info(
-        f"☑️ COMPLETED: {mapping_type.title()} Query/Table Mapping completed."
-    )
+    log.info("☑️ COMPLETED: Query/Table Mappings completed.")
     log.info("---------------------------------------------------------------")
 
 
@@ -439,17 +529,17 @@ def drop_role(database: str):
         database (str): Name of the target PostgreSQL database.
 
     Raises:
-        SystemExit: If role drop fails due to execution errors or invalid
+        ETLError: If role drop fails due to execution errors or invalid
         configuration.
     """
 
-    log.info(f"➡️ STARTING: Dropping role {config("DB_ROLE")}.")
+    log.info("➡️ STARTING: Dropping role %s.", DB_ROLE)
     success = pgdb.drop_pg_role(database, use_default=True)
 
     if not success:
-        sys.exit("⛓️‍💥 EXITING: Role failed to drop.")
+        raise ETLError("⛓️‍💥 EXITING: Role failed to drop.")
 
-    log.info(f"☑️ COMPLETED: Role {config("DB_ROLE")} dropped.")
+    log.info("☑️ COMPLETED: Role %s dropped.", DB_ROLE)
     log.info("---------------------------------------------------------------")
 
 
@@ -465,20 +555,49 @@ def drop_database(database: str):
         database (str): Name of the database to drop.
 
     Raises:
-        SystemExit: If the database drop operation fails due to execution
+        ETLError: If the database drop operation fails due to execution
         errors or invalid configuration.
     """
 
-    log.info(f"➡️ STARTING: Dropping database: {database}.")
+    log.info("➡️ STARTING: Dropping database: %s.", database)
     success = pgdb.drop_pg_database(database)
 
     if not success:
-        sys.exit("⛓️‍💥 EXITING: Database failed to drop.")
+        raise ETLError("⛓️‍💥 EXITING: Database failed to drop.")
 
-    log.info(f"☑️ COMPLETED: Database {database} dropped.")
+    log.info("☑️ COMPLETED: Database %s dropped.", database)
     log.info("---------------------------------------------------------------")
 
 
+def str_to_bool(value: str) -> bool:
+    """
+    Converts a command-line string argument to a boolean.
+
+    Accepts common truthy and falsy spellings (case-insensitive) so that
+    values such as `False`, `0` or `no` are not treated as truthy strings.
+
+    Args:
+        value (str): Raw argument value supplied on the command line.
+
+    Returns:
+        bool: True for `1`, `true`, `t`, `yes`, `y`; False for `0`, `false`,
+        `f`, `no`, `n`.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a recognized boolean.
+    """
+
+    match value.strip().lower():
+        case "1" | "true" | "t" | "yes" | "y":
+            return True
+        case "0" | "false" | "f" | "no" | "n":
+            return False
+        case _:
+            raise argparse.ArgumentTypeError(
+                f"Boolean value expected, got '{value}'."
+            )
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Set ETL options")
 
@@ -487,10 +606,14 @@ if __name__ == "__main__":
     )
 
     parser.add_argument(
-        "-s", "--seed-test-database", type=str,
+        "-s", "--seed-test-database", type=str_to_bool,
         required=True, help="Seed Test Database"
     )
 
     args = parser.parse_args()
 
-    main(args)
+    try:
+        main(args)
+    except ETLError as error:
+        log.exception(error)
+        sys.exit(2)
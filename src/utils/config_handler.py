@@ -0,0 +1,52 @@
+"""
+Module: config_handler
+======================
+
+This module resolves the environment-driven settings shared by the ETL
+modules once, at import time, so that callers reuse the same constants
+instead of re-reading the environment and rebuilding paths.
+
+Constants
+---------
+- SQL_PATH : Root directory for query files and mapping CSV.
+- SOURCE_PATH : Directory containing the source SELECT query files.
+- DESTINATION_PATH : Directory containing the destination DDL/DML files.
+- MAPPING_FILE : CSV file containing the query/table mappings.
+- SOURCE_FILE : JSON file containing the generated source mappings.
+- DESTINATION_FILE : JSON file containing the generated destination mappings.
+- DB_ROLE : Role name used for PostgreSQL access control.
+- ETL_UNSAFE_FAST : Whether bulk loads trade durability for throughput.
+
+Environment Variables
+---------------------
+- SQL_PATH : str
+    Root directory for query files and mapping CSV.
+- DB_ROLE : str
+    Role name used for PostgreSQL access control.
+- ETL_UNSAFE_FAST : bool, optional
+    Disables synchronous commit on bulk-load sessions (defaults to False).
+    A crash may lose the last committed loads, which is acceptable for a
+    rebuild that can simply be re-run.
+
+Dependencies
+------------
+- decouple.config : Environment variable management.
+- pathlib : Platform-independent path handling.
+"""
+
+from pathlib import Path
+from typing import Final
+from decouple import config
+
+
+SQL_PATH: Final[Path] = Path(config("SQL_PATH"))
+SOURCE_PATH: Final[Path] = SQL_PATH / "source"
+DESTINATION_PATH: Final[Path] = SQL_PATH / "destination"
+MAPPING_FILE: Final[Path] = SQL_PATH / "mapping.csv"
+SOURCE_FILE: Final[Path] = SQL_PATH / "mapping_source.json"
+DESTINATION_FILE: Final[Path] = SQL_PATH / "mapping_destination.json"
+
+DB_ROLE: Final[str] = config("DB_ROLE")
+ETL_UNSAFE_FAST: Final[bool] = config(
+    "ETL_UNSAFE_FAST", default=False, cast=bool
+)
@@ -8,26 +8,177 @@ logging, validation, and error handling to support robust backend operations.
 
 Dependencies
 ------------
-- json : For loading JSON content from disk.
+- orjson : Optional native JSON parser/serializer; used when installed.
+- ijson : Optional streaming JSON parser; used by iter_json_items when
+installed.
+- json : For loading JSON content from disk when orjson is not installed.
+- functools : For caching parsed JSON and query files per file version.
+- sys : For interning cached query strings.
+- mmap, os : For memory-mapping JSON files and unbuffered query file reads.
+- pathlib : For path type annotations.
 - typing : For type annotations.
 - utils.logging_handler.logger : Custom logger for structured logging.
 - utils.validation_handler : Validation utilities for list integrity checks.
 
 Functions
 ---------
+- cache_by_file_version : Decorator caching a file parser per path, mtime and
+size.
 - read_json_file : Loads and validates a JSON file containing query
 definitions.
 - load_json_file : Reads raw JSON content from disk and returns a success flag.
+- parse_json_file : Parses a JSON file, cached per file version.
+- read_file_bytes : Reads a whole file with a single unbuffered read.
+- parse_query_file : Reads and cleans a SQL query file, cached per file
+version.
 - read_query_from_file : Reads a raw SQL query from a text file.
 - get_query_list_from_file : Extracts a list of query tuples from JSON content.
+- json_loads : Parses JSON bytes with orjson, falling back to the stdlib.
+- json_dumps : Serializes data to compact JSON bytes with orjson, falling back
+to the stdlib.
+- iter_json_items : Streams the items of a JSON file one at a time with ijson.
 """
 
 import json
-from typing import Tuple
+import mmap
+import os
+import sys
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import Iterator, Tuple
 
 from utils.logging_handler import logger as log
 import utils.validation_handler as vh
 
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional dependency
+    ijson = None
+
+
+# read buffer size for JSON files streamed by iter_json_items; whole-file
+# reads and memory-mapped files use the default buffering
+READ_BUFFER_SIZE = 1 << 20
+
+# flags for descriptor-level reads; O_BINARY disables newline translation
+# on Windows and does not exist elsewhere
+READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+# JSON files of at least this size are memory-mapped instead of read
+MMAP_THRESHOLD = 256 * 1024
+
+# line break and tab bytes removed from query text; carriage returns are
+# included because the file is read in binary mode, without newline
+# translation
+QUERY_WHITESPACE = b"\r\n\t"
+
+
+def json_loads(content):
+    """
+    Parse JSON content using orjson when available.
+
+    orjson parses buffer-protocol objects in place, so a memory-mapped file
+    is decoded without first being copied into a `bytes` object. The stdlib
+    fallback requires a `bytes` copy.
+
+    Parameters
+    ----------
+    content : bytes or buffer
+        Raw JSON document, e.g. `bytes` or an `mmap.mmap`.
+
+    Returns
+    -------
+    Any
+        Parsed JSON content.
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If the content is not valid JSON (orjson's decode error subclasses
+        it).
+    """
+    if orjson is not None:
+        # release the view before the caller closes the underlying buffer
+        with memoryview(content) as view:
+            return orjson.loads(view)
+
+    return json.loads(bytes(content))
+
+
+def json_dumps(data) -> bytes:
+    """
+    Serialize data to compact JSON bytes using orjson when available.
+
+    Parameters
+    ----------
+    data : Any
+        JSON-serializable data.
+
+    Returns
+    -------
+    bytes
+        UTF-8 encoded JSON document without insignificant whitespace.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+
+    return json.dumps(data, separators=(",", ":")).encode("UTF-8")
+
+
+def cache_by_file_version(maxsize: int = 32):
+    """
+    Cache the results of a file parser per file version.
+
+    The decorated function takes a single path argument. Each call stats
+    the file and looks the result up by path, modification time and size,
+    so an edited file is parsed again while unchanged files are served from
+    the cache. Calls that raise are never cached, and missing files raise
+    `FileNotFoundError` from the stat.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of file versions kept in the cache. Defaults to 32.
+
+    Returns
+    -------
+    Callable
+        Decorator wrapping a `parse(path: str)` function. The wrapper accepts
+        a str or Path and exposes `cache_info` and `cache_clear`.
+
+    Example
+    -------
+    >>> @cache_by_file_version(maxsize=16)
+    ... def parse_text_file(path: str) -> str:
+    ...     return Path(path).read_text()
+    """
+
+    def decorator(parse):
+        @lru_cache(maxsize=maxsize)
+        def parse_version(path: str, mtime_ns: int, size: int):
+            # mtime and size only key the cache, they are not parsed
+            return parse(path)
+
+        @wraps(parse)
+        def wrapper(path: str | Path):
+            stat = os.stat(path)
+
+            return parse_version(
+                os.fspath(path), stat.st_mtime_ns, stat.st_size
+            )
+
+        wrapper.cache_info = parse_version.cache_info
+        wrapper.cache_clear = parse_version.cache_clear
+
+        return wrapper
+
+    return decorator
+
 
 def read_json_file(name: str, file: str) -> Tuple[bool, list]:
     """
@@ -61,8 +212,9 @@ def read_json_file(name: str, file: str) -> Tuple[bool, list]:
     (True, [...])
     """
 
+    success = False
     # instantiate queries string variable
-    queries: list = list()
+    queries: list = []
 
     try:
         # load json data from file into queries variable
@@ -70,34 +222,77 @@ def read_json_file(name: str, file: str) -> Tuple[bool, list]:
 
         # test if queries variable is empty
         if success:
-            log.info(f"🟢 SUCCESS: {name} JSON file read.")
+            log.info("🟢 SUCCESS: %s JSON file read.", name)
         else:
-            log.error(f"🔴 FAILED:{name} JSON file was not read.")
+            log.error("🔴 FAILED: %s JSON file was not read.", name)
 
         success = False
         # test if queries list is not empty
         success = vh.validate_list(f"{name} JSON File", queries)
 
-        # return success boolean and queries variable
-        return success, queries
-
     except FileNotFoundError as error:
         log.error(error)
 
     except Exception as e:  # pylint: disable=broad-except
         log.error(e)
 
+    # return success boolean and queries variable
+    return success, queries
+
+
+@cache_by_file_version(maxsize=32)
+def parse_json_file(path: str) -> list:
+    """
+    Parse a JSON file, cached per file version by `cache_by_file_version`.
+
+    Parameters
+    ----------
+    path : str
+        Path to the JSON file.
+
+    Returns
+    -------
+    list
+        Parsed JSON content, or an empty list for a zero-length file.
+    """
+
+    # instantiate data list variable
+    data: list = []
+
+    # map large json files into memory and read small ones in one call,
+    # then parse into data list variable; zero-length files cannot be
+    # mapped and hold no data
+    with open(path, "rb") as json_file:
+        size = os.fstat(json_file.fileno()).st_size
+
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(
+                json_file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as content:
+                data = json_loads(content)
+        elif size:
+            data = json_loads(json_file.read())
 
-def load_json_file(file: str) -> Tuple[bool, list]:
+    return data
+
+
+def load_json_file(file: str | Path) -> Tuple[bool, list]:
     """
     Load raw JSON content from a file.
 
-    This function opens a JSON file, parses its contents, and returns a
-    success flag along with the loaded data.
+    This function reads a JSON file (memory-mapping files of at least
+    MMAP_THRESHOLD bytes), parses its contents with orjson (or the stdlib
+    `json` module if orjson is not installed), and returns a success flag
+    along with the loaded data.
+
+    Parsed content is cached per file version by `parse_json_file`, so
+    repeated reads of an unchanged mapping file skip the read and parse,
+    and rewritten files are picked up automatically. The returned data is
+    shared between callers and must not be modified in place.
 
     Parameters
     ----------
-    file : str
+    file : str or Path
         Path to the JSON file.
 
     Returns
@@ -105,7 +300,8 @@ def load_json_file(file: str) -> Tuple[bool, list]:
     Tuple[bool, list]
         A tuple containing:
         - success (bool): True if the file was loaded successfully.
-        - data (list): Parsed JSON content.
+        - data (list): Parsed JSON content, empty if the file could not be
+          loaded.
 
     Logging
     -------
@@ -120,21 +316,16 @@ def load_json_file(file: str) -> Tuple[bool, list]:
 
     success = False
     # instantiate data list variable
-    data: list = list()
+    data: list = []
 
     try:
-        # open json file
-        with open(file, "r", encoding="UTF-8") as file:
-            # append loaded json file to data list variable
-            data = json.load(file)
+        # look up the parsed file by its current version
+        data = parse_json_file(file)
 
-            if not data:
-                raise FileNotFoundError
-            else:
-                success = True
-
-            # return data list variable with json data
-            return success, data
+        if not data:
+            raise FileNotFoundError
+        else:
+            success = True
 
     except FileNotFoundError as error:
         log.error(error, exc_info=True)
@@ -145,25 +336,167 @@ def load_json_file(file: str) -> Tuple[bool, list]:
     except Exception as e:  # pylint: disable=broad-except
         log.error(e, exc_info=True)
 
+    # return success boolean and data list variable with json data
+    return success, data
 
-def read_query_from_file(path: str) -> Tuple[bool, str]:
+
+def iter_json_items(file: str | Path, prefix: str = "item") -> Iterator:
     """
-    Read a raw SQL query from a text file.
+    Stream the items of a JSON file one at a time.
+
+    With ijson installed, items are parsed incrementally while the file is
+    read (ijson selects its fastest available backend, e.g. yajl2_c), so
+    only one item is held in memory at a time. This trades raw speed for
+    memory: for files that fit comfortably in memory `load_json_file` is
+    faster. Without ijson the file is parsed whole by `load_json_file` and
+    its top-level array is iterated; the yielded items are then the shared
+    objects cached by `parse_json_file` and must not be modified in place.
+
+    Parameters
+    ----------
+    file : str or Path
+        Path to the JSON file.
+    prefix : str, optional
+        ijson prefix of the items to yield. Defaults to "item", the elements
+        of a top-level array; the fallback only supports this prefix.
+
+    Yields
+    ------
+    Any
+        Parsed JSON items in document order.
+
+    Raises
+    ------
+    ValueError
+        If ijson is not installed and `prefix` is not "item", or the file
+        cannot be loaded by `load_json_file`.
+
+    Logging
+    -------
+    Logs and re-raises errors raised while reading or parsing the file.
+
+    Example
+    -------
+    >>> for table in iter_json_items("mapping_source.json"):
+    ...     print(table["table_id"])
+    """
+
+    try:
+        if ijson is None:
+            if prefix != "item":
+                raise ValueError(f"prefix '{prefix}' requires ijson.")
+
+            # parse the whole file and iterate its top-level array
+            success, data = load_json_file(file)
+
+            if not success:
+                raise ValueError(f"{file} could not be loaded.")
+
+            yield from data
+            return
+
+        # parse items incrementally as the file is read
+        with open(file, "rb", buffering=READ_BUFFER_SIZE) as json_file:
+            yield from ijson.items(json_file, prefix)
+
+    except Exception as e:  # pylint: disable=broad-except
+        log.error(e, exc_info=True)
+        raise
+
 
-    This function opens a file containing a SQL query, strips newline and tab
-    characters, and returns the cleaned query string.
+def read_file_bytes(path: str | Path) -> bytes:
+    """
+    Read the whole content of a file with unbuffered reads.
+
+    The file is opened in binary mode at the descriptor level and read with
+    `read(2)` calls sized from `fstat`, skipping the buffered reader that
+    `open` sets up. A read may return fewer bytes than requested, so reads
+    continue until end of file; for a regular file the first read usually
+    returns everything. This is meant for small files such as SQL queries,
+    where the setup cost of the buffered reader outweighs the read itself.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to the file.
+
+    Returns
+    -------
+    bytes
+        Raw content of the file.
+
+    Raises
+    ------
+    OSError
+        If the file cannot be opened or read.
+    """
+
+    fd = os.open(path, READ_FLAGS)
+
+    try:
+        size = os.fstat(fd).st_size or 1
+        chunks: list = [os.read(fd, size)]
+
+        # read on until end of file in case a read returned short
+        while chunks[-1]:
+            chunks.append(os.read(fd, size))
+
+        return b"".join(chunks)
+
+    finally:
+        os.close(fd)
+
+
+@cache_by_file_version(maxsize=128)
+def parse_query_file(path: str) -> str:
+    """
+    Read and clean a SQL query file, cached per file version by
+    `cache_by_file_version`.
+
+    Queries are interned so that identical query strings share a single
+    object.
 
     Parameters
     ----------
     path : str
         Path to the query file.
 
+    Returns
+    -------
+    str
+        Query string with line breaks and tabs removed.
+    """
+
+    # strip line breaks and tabs from the raw bytes in a single pass and
+    # decode into the query string
+    return sys.intern(read_file_bytes(path).translate(
+        None, QUERY_WHITESPACE
+    ).decode("UTF-8"))
+
+
+def read_query_from_file(path: str | Path) -> Tuple[bool, str]:
+    """
+    Read a raw SQL query from a text file.
+
+    This function reads a file containing a SQL query as bytes, strips line
+    break and tab characters, and returns the decoded query string.
+
+    Cleaned queries are cached per file version by `parse_query_file`, so
+    queries read once per batch skip the file read and cleanup after the
+    first call.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to the query file.
+
     Returns
     -------
     Tuple[bool, str]
         A tuple containing:
         - success (bool): True if the query was read successfully.
-        - query (str): Cleaned SQL query string.
+        - query (str): Cleaned SQL query string, empty if the file could not
+          be read.
 
     Logging
     -------
@@ -175,28 +508,25 @@ def read_query_from_file(path: str) -> Tuple[bool, str]:
     (True, "CREATE TABLE ...") 
     """
     success = False
-    # instantiate query list variable
-    query: str = None
+    # instantiate query string variable
+    query: str = ""
 
     try:
-        # open query file
-        with open(path, "r", encoding="UTF-8") as query:
-            # read query file
-            # load into query variable
-            query = query.read().replace("\n", "").replace("\t", "")
+        # look up the cleaned query by the file's current version
+        query = parse_query_file(path)
 
         if query:
             success = True
 
-        # return success bool and query list variable
-        return success, query
-
     except FileNotFoundError as error:
         log.error(error, exc_info=True)
 
     except Exception as e:  # pylint: disable=broad-except
         log.error(e, exc_info=True)
 
+    # return success bool and query string variable
+    return success, query
+
 
 def get_query_list_from_file(name: str, queries: str) -> Tuple[bool, list]:
     """
@@ -218,11 +548,12 @@ def get_query_list_from_file(name: str, queries: str) -> Tuple[bool, list]:
     Tuple[bool, list]
         A tuple containing:
         - success (bool): True if the query list was constructed successfully.
-        - query_list (list): List of (table_id, query_string) tuples.
+        - query_list (list): List of (table_id, query_string) tuples, empty
+          on failure.
 
     Logging
     -------
-    Logs success for each query added and failure if the list is empty.
+    Logs a single success summary, or a failure if the list is empty.
 
     Example
     -------
@@ -232,24 +563,25 @@ def get_query_list_from_file(name: str, queries: str) -> Tuple[bool, list]:
 
     success = False
     # instantiate query_list list variable
-    query_list: list = list()
+    query_list: list = []
 
     try:
-        for query in queries:
-            # append create query to query_list variable
-            query_list.append((int(query["table_id"]), query[f"{name}"]))
-
-            log.info(f"🟢 SUCCESS: {query[f'{name}']} added to query list.")
+        # build (table_id, query) tuples for every mapping entry
+        query_list = [(query["table_id"], query[name]) for query in queries]
 
         # test if query_list is not empty
-        success = vh.validate_list(f"{name}", query_list)
+        success = vh.validate_list(name, query_list)
 
-        if not success:
-            log.error(f"🔴 FAILED: {query[f'{name}']} not added to query \
-                        list.")
-
-        # return success boolean and query_list variable
-        return success, query_list
+        if success:
+            log.info(
+                "🟢 SUCCESS: %d %s entries added to query list.",
+                len(query_list), name
+            )
+        else:
+            log.error("🔴 FAILED: %s entries not added to query list.", name)
 
     except Exception as e:  # pylint: disable=broad-except
         log.error(e, exc_info=True)
+
+    # return success boolean and query_list variable
+    return success, query_list
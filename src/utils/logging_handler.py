@@ -29,9 +29,15 @@ Logging Behavior
 - All logs are timestamped and formatted for readability.
 - Console output uses simplified formatting.
 - Error logs are duplicated to `error.log` regardless of global level.
+- Handlers are attached once, log files are UTF-8 encoded and only opened
+  when the first record is written.
 
 Handlers
 --------
+- RecordQueueHandler : Enqueues a copy of each record with its message
+  rendered on the calling thread.
+- QueueListener : Background thread formatting and dispatching queued
+  records to the handlers below; stopped and flushed at interpreter exit.
 - FileHandler : Writes logs to dynamically selected log file.
 - StreamHandler : Outputs logs to stderr for console visibility.
 - ErrorHandler : Captures and writes ERROR-level logs to `error.log`.
@@ -52,49 +58,101 @@ Notes
 - Designed for extensibility and integration with external monitoring tools.
 """
 
+import atexit
+import copy
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
 from decouple import config
 
 
-LOGS_PATH = config("LOGS_PATH")
+LOGS_PATH = Path(config("LOGS_PATH"))
 
 logger = logging.getLogger()
 log_level = getattr(logging, config("LOG_LEVEL"), None)
 
-log_file: str = None
-match log_level:
-    case logging.INFO:
-        log_file = "app.log"
-    case logging.DEBUG:
-        log_file = "debug.log"
-    case logging.ERROR:
-        log_file = "error.log"
-    case _:
-        log_file = "app.log"
-
-
-logging.basicConfig(
-    filename=f"{LOGS_PATH}\\{log_file}",
-    level=log_level,
-    format='%(asctime)s - %(levelname)s - %(name)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
-
-# define a Handler which writes LOG_LEVEL messages or higher to the sys.stderr
-console = logging.StreamHandler()
-console.setLevel(log_level)
-
-# set a format which is simpler for console use
-formatter = logging.Formatter('%(name)-12s: %(levelname)-8s %(message)s')
-
-# tell the handler to use this format
-console.setFormatter(formatter)
-
-# write ERROR messages to error log
-error_file_handler = logging.FileHandler(f"{LOGS_PATH}\\error.log")
-error_file_handler.setLevel(logging.ERROR)
-
-# add the handler to the root logger
-logger.addHandler(console)
-# add error_file_handler to logger
-logger.addHandler(error_file_handler)
+# log file written for each supported log level
+LOG_FILES = {
+    logging.INFO: "app.log",
+    logging.DEBUG: "debug.log",
+    logging.ERROR: "error.log",
+}
+
+log_file: str = LOG_FILES.get(log_level, "app.log")
+
+
+class RecordQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves record formatting to the listener thread.
+
+    `QueueHandler.prepare` fully formats each record, including any
+    traceback, on the calling thread so that records can be pickled. The
+    queue here never leaves the process, so only the message is rendered
+    from its arguments before enqueueing; the timestamp, level and
+    traceback are formatted by each listener handler. The record is copied,
+    so other handlers of the same record never share its state with the
+    listener, and arguments changed after the log call are not reflected.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # render the message now, while the arguments still hold the values
+        # they had at the log call
+        message = record.getMessage()
+
+        record = copy.copy(record)
+        record.msg = message
+        record.args = None
+
+        return record
+
+
+# configure the root logger once; importing this module again or from
+# another entry point must not attach duplicate handlers
+if not logger.handlers:
+    logger.setLevel(log_level)
+
+    # write LOG_LEVEL messages or higher to the level's log file; the file
+    # is only opened when the first record is written
+    file_handler = logging.FileHandler(
+        LOGS_PATH / log_file, encoding="UTF-8", delay=True
+    )
+    file_handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(levelname)s - %(name)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+
+    # define a Handler which writes LOG_LEVEL messages or higher to the
+    # sys.stderr
+    console = logging.StreamHandler()
+    console.setLevel(log_level)
+
+    # set a format which is simpler for console use
+    formatter = logging.Formatter('%(name)-12s: %(levelname)-8s %(message)s')
+
+    # tell the handler to use this format
+    console.setFormatter(formatter)
+
+    handlers: list = [file_handler, console]
+
+    # write ERROR messages to error log, unless the level's log file
+    # already is the error log
+    if log_file != "error.log":
+        error_file_handler = logging.FileHandler(
+            LOGS_PATH / "error.log", encoding="UTF-8", delay=True
+        )
+        error_file_handler.setLevel(logging.ERROR)
+        handlers.append(error_file_handler)
+
+    # log calls only render the message and enqueue the record; a background
+    # listener thread formats tracebacks and log lines and writes them to the
+    # file and console handlers
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    # flush queued records and stop the listener thread on interpreter exit
+    atexit.register(listener.stop)
+
+    # add the queue handler to the root logger
+    logger.addHandler(RecordQueueHandler(log_queue))
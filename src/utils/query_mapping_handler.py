@@ -9,187 +9,322 @@ validated JSON records for downstream consumption.
 
 Dependencies
 ------------
-- pandas : For DataFrame operations and CSV/JSON I/O.
-- os : For file existence checks.
+- csv : For streaming rows from the mapping CSV file.
+- os : For comparing mapping file modification times and replacing
+generated mapping files atomically.
+- operator : For the C-level mapping sort key.
+- utils.file_handler : JSON serialization (orjson with stdlib fallback) and
+per file version caching.
 - utils.logging_handler.logger : Custom logger for structured error and
 success reporting.
 
 Functions
 ---------
+- parse_mapping_file : Parses a mapping CSV file, cached per file version.
+- get_mapping_data : Extracts and filters source and destination mapping
+records from a CSV file in a single pass.
 - get_source_mapping_data : Extracts and filters source mapping records from a
 CSV file.
 - get_destination_mapping_data : Extracts and filters destination mapping
 records from a CSV file.
-- write_mapping_data : Serializes a DataFrame to JSON and verifies output
-creation.
+- write_mapping_data : Serializes mapping records to JSON and verifies the
+bytes written.
+- mapping_data_is_current : Checks whether generated JSON mappings are newer
+than their mapping CSV.
 """
 
+import csv
 import os
-import pandas as pd
+from operator import itemgetter
+from pathlib import Path
+from typing import Tuple
 
+import utils.file_handler as fh
 from utils.logging_handler import logger as log
 
 
-def get_source_mapping_data(filename: str) -> pd.DataFrame:
+# sort key ordering mapping records by execution order, then table id
+MAPPING_ORDER = itemgetter("execution_order", "table_id")
+
+
+@fh.cache_by_file_version(maxsize=16)
+def parse_mapping_file(path: str) -> Tuple[list, list]:
     """
-    Load and filter source mapping data from a CSV file.
+    Parse a mapping CSV file, cached per file version by
+    `utils.file_handler.cache_by_file_version`.
+
+    Parameters
+    ----------
+    path : str
+        Path to the CSV file containing the mapping data.
+
+    Returns
+    -------
+    Tuple[list, list]
+        Sorted source and destination records, as described in
+        `get_mapping_data`.
+    """
+    source: list = []
+    destination: list = []
 
-    This function reads a CSV file containing source mapping definitions,
-    filters for application-specific tables, and returns a sorted DataFrame
-    excluding the `is_app_table` column.
+    # read csv file row by row
+    with open(path, "r", encoding="UTF-8", newline="") as file:
+        rows = csv.reader(file)
+
+        # resolve column positions once from the header row
+        header = next(rows, [])
+        is_app_table = header.index("is_app_table")
+        execution_order = header.index("execution_order")
+        table_id = header.index("table_id")
+        source_query_select = header.index("source_query_select")
+        destination_query_create = header.index("destination_query_create")
+        destination_query_insert = header.index("destination_query_insert")
+
+        for row in rows:
+            # skip blank lines, which csv.reader returns as empty rows
+            if not row:
+                continue
+
+            # filter data
+            if int(row[is_app_table] or 0) != 1:
+                continue
+
+            # cast ids once here; the json mappings store integers so
+            # consumers can sort and index on them without casting
+            order = int(row[execution_order])
+            table = int(row[table_id])
+
+            # split row into source and destination records
+            source.append({
+                "execution_order": order,
+                "table_id": table,
+                "source_query_select": row[source_query_select],
+            })
+            destination.append({
+                "execution_order": order,
+                "table_id": table,
+                "destination_query_create": row[destination_query_create],
+                "destination_query_insert": row[destination_query_insert],
+            })
+
+    # sort data
+    source.sort(key=MAPPING_ORDER)
+    destination.sort(key=MAPPING_ORDER)
+
+    return source, destination
+
+
+def get_mapping_data(filename: str | Path) -> Tuple[list, list]:
+    """
+    Load and filter source and destination mapping data in a single pass.
+
+    This function streams a CSV file containing the query/table mapping
+    definitions once, keeps only application-specific tables, and fans each
+    row out into a source and a destination record. Column positions are
+    resolved from the header row once, so rows are read as plain lists
+    rather than a dictionary per row. Both lists are sorted by execution
+    order and table ID and exclude the `is_app_table` column.
+
+    Parsed records are cached per file version by `parse_mapping_file`; the
+    returned lists are shared and must not be modified in place.
 
     Parameters
     ----------
-    filename : str
-        Path to the CSV file containing source mapping data.
+    filename : str or Path
+        Path to the CSV file containing the mapping data.
 
     Returns
     -------
-    pd.DataFrame
-        Filtered and sorted DataFrame with columns:
-        - source_query_select
-        - table_id (nullable integer)
-        - execution_order
+    Tuple[list, list]
+        A tuple containing:
+        - source (list): Dictionaries with keys execution_order (int),
+          table_id (int) and source_query_select.
+        - destination (list): Dictionaries with keys execution_order (int),
+          table_id (int), destination_query_create and
+          destination_query_insert.
+        Both lists are empty if the file cannot be read.
 
     Logging
     -------
-    Logs errors if the file is not found or if any exception occurs during
-    processing.
+    Logs errors with traceback if the file cannot be read, lacks a mapping
+    column or contains a malformed row.
 
     Example
     -------
-    >>> get_source_mapping_data("source_mappings.csv")
-    pd.DataFrame([...])
+    >>> source, destination = get_mapping_data("mapping.csv")
+    >>> source[0]
+    {'execution_order': 0, 'table_id': 1, 'source_query_select': ...}
     """
     try:
-        # specify columns
-        columns = [
-            "source_query_select",
-            "table_id",
-            "execution_order",
-            "is_app_table"
-        ]
-        # read csv file into dataframe
-        df = pd.read_csv(filename, usecols=columns)
-        df['table_id'] = df['table_id'].astype(pd.Int64Dtype())
-        # filter data
-        filtered_df = df[df['is_app_table'] == 1]
-        # drop is_app_table column
-        df = filtered_df.drop('is_app_table', axis=1)
-        # sort data
-        data = df.sort_values(by=[
-            'execution_order',
-            'table_id'
-        ])
-        return data
-
-    except FileNotFoundError as e:
-        log.error(e)
-    except Exception as e:  # pylint disable=broad-except
-        log.error(e)
-
-
-def get_destination_mapping_data(filename: str) -> pd.DataFrame:
+        # look up the parsed file by its current version
+        return parse_mapping_file(filename)
+
+    except (OSError, ValueError, IndexError, csv.Error):
+        # missing or unreadable file, missing column or malformed row
+        log.exception("🔴 ERROR: %s could not be loaded.", filename)
+
+    return [], []
+
+
+def get_source_mapping_data(filename: str | Path) -> list:
+    """
+    Load and filter source mapping data from a CSV file.
+
+    Convenience wrapper around `get_mapping_data` returning only the source
+    records.
+
+    Parameters
+    ----------
+    filename : str or Path
+        Path to the CSV file containing source mapping data.
+
+    Returns
+    -------
+    list
+        Filtered and sorted list of dictionaries with keys:
+        - execution_order (int)
+        - table_id (int)
+        - source_query_select
+
+    Example
+    -------
+    >>> get_source_mapping_data("source_mappings.csv")
+    [{'execution_order': 0, 'table_id': 1, ...}, ...]
+    """
+    return get_mapping_data(filename)[0]
+
+
+def get_destination_mapping_data(filename: str | Path) -> list:
     """
     Load and filter destination mapping data from a CSV file.
 
-    This function reads a CSV file containing destination mapping definitions,
-    filters for application-specific tables, and returns a sorted DataFrame
-    excluding the `is_app_table` column.
+    Convenience wrapper around `get_mapping_data` returning only the
+    destination records.
 
     Parameters
     ----------
-    filename : str
+    filename : str or Path
         Path to the CSV file containing destination mapping data.
 
     Returns
     -------
-    pd.DataFrame
-        Filtered and sorted DataFrame with columns:
+    list
+        Filtered and sorted list of dictionaries with keys:
+        - execution_order (int)
+        - table_id (int)
         - destination_query_create
         - destination_query_insert
-        - table_id (nullable integer)
-        - execution_order
-
-    Logging
-    -------
-    Logs errors with traceback if the file is not found or if any exception
-    occurs.
 
     Example
     -------
     >>> get_destination_mapping_data("destination_mappings.csv")
-    pd.DataFrame([...])
+    [{'execution_order': 0, 'table_id': 1, ...}, ...]
     """
-    try:
-        # specify columns
-        columns = [
-            "destination_query_create",
-            "destination_query_insert",
-            "table_id",
-            "execution_order",
-            "is_app_table",
-        ]
-        # read csv file into dataframe
-        df = pd.read_csv(filename, usecols=columns)
-        df['table_id'] = df['table_id'].astype(pd.Int64Dtype())
-        # filter data
-        filtered_df = df[df['is_app_table'] == 1]
-        # drop is_app_table column
-        df = filtered_df.drop('is_app_table', axis=1)
-        # sort data
-        data = df.sort_values(
-            by=["execution_order", "table_id"]
-        )
-        return data
-    except FileNotFoundError as e:
-        log.error(e, exc_info=True)
-    except Exception as e:  # pylint disable=broad-except
-        log.error(e, exc_info=True)
-
-
-def write_mapping_data(data: pd.DataFrame, output_filename: str) -> bool:
+    return get_mapping_data(filename)[1]
+
+
+def write_mapping_data(data: list, output_filename: str | Path) -> bool:
     """
     Write mapping data to a JSON file and confirm output creation.
 
-    This function serializes the provided DataFrame to a JSON file using
-    record orientation. It verifies that the file was successfully created
-    and logs a success message with the filename.
+    This function serializes the provided mapping records to a compact JSON
+    array. It verifies that every serialized byte was written and logs a
+    success message with the filename.
+
+    The JSON is written to a temporary file next to the output and moved
+    into place with `os.replace`, so an interrupted write never leaves a
+    partial file behind that `mapping_data_is_current` would accept.
 
     Parameters
     ----------
-    data : pd.DataFrame
-        The mapping data to be written to disk.
-    output_filename : str
+    data : list
+        The mapping records to be written to disk.
+    output_filename : str or Path
         The target filename for the JSON output.
 
     Returns
     -------
     bool
-        True if the file was successfully created, False otherwise.
+        True if the file was fully written, False otherwise.
 
     Logging
     -------
-    Logs success with filename if output is created.
-    Logs errors with traceback if any exception occurs.
+    Logs success with filename if output is written.
+    Logs errors with traceback if the file cannot be written or the records
+    cannot be serialized.
 
     Example
     -------
-    >>> write_mapping_data(df, "output.json")
+    >>> write_mapping_data(records, "output.json")
     True
     """
     success = False
 
     try:
-        # write mapping data to output filename
-        data.to_json(output_filename, orient="records")
-        success = os.path.isfile(output_filename)
+        # write mapping data to a temporary file beside the output filename
+        content = fh.json_dumps(data)
+        path = Path(output_filename)
+        temp_path = path.with_name(f"{path.name}.tmp")
+
+        try:
+            with open(temp_path, "wb") as file:
+                success = file.write(content) == len(content)
+                file.flush()
+                os.fsync(file.fileno())
+
+            # atomically replace the output with the complete file
+            if success:
+                os.replace(temp_path, path)
+                log.info("🟢 SUCCESS: %s created.", path.name)
+
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    except (OSError, TypeError, ValueError):
+        # unwritable file or records that cannot be serialized
+        log.exception("🔴 ERROR: %s could not be written.", output_filename)
+
+    return success
+
+
+def mapping_data_is_current(
+        mapping_file: str | Path, *output_files: str | Path) -> bool:
+    """
+    Check whether generated mapping files are up to date with their CSV.
+
+    The JSON mappings are derived from the mapping CSV only, so when every
+    output file exists, is not empty and was modified no earlier than the
+    CSV, writing them again would reproduce the same content.
+
+    Parameters
+    ----------
+    mapping_file : str or Path
+        Path to the CSV file containing the mapping data.
+    *output_files : str or Path
+        Paths to the JSON files generated from the mapping CSV.
+
+    Returns
+    -------
+    bool
+        True if all output files exist, are not empty and are at least as
+        new as the CSV, False otherwise.
+
+    Example
+    -------
+    >>> mapping_data_is_current("mapping.csv", "source.json", "dest.json")
+    True
+    """
+    try:
+        mtime_ns = os.stat(mapping_file).st_mtime_ns
+
+        for output_file in output_files:
+            stat = os.stat(output_file)
 
-        if success:
-            index = output_filename.rfind("\\")+1
-            log.info(f"🟢 SUCCESS: {output_filename[index:].strip()} created.")
+            # empty or older output files have to be written again
+            if not stat.st_size or stat.st_mtime_ns < mtime_ns:
+                return False
 
-        return success
+        return True
 
-    except Exception as e:  # pylint disable=broad-except
-        log.error(e, exc_info=True)
+    except FileNotFoundError:
+        return False
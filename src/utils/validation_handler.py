@@ -10,13 +10,12 @@ and logging is required for debugging or audit trails.
 
 Functions:
 ----------
-- validate_list: Validates whether a given list is non-empty and logs errors
-if validation fails.
+- validate_list: Validates whether a given list is non-empty and logs a
+warning if validation fails.
 
 Dependencies:
 -------------
-- utils.logging_handler.logger: Custom logger used for info, debug, and error
-reporting.
+- utils.logging_handler.logger: Custom logger used for warning reporting.
 """
 
 from utils.logging_handler import logger as log
@@ -29,14 +28,14 @@ def validate_list(name: str, list_object: list) -> bool:
     This function checks whether the provided list object contains any
     elements.
 
-    If the list is empty or an exception occurs during evaluation, it logs an
-    error with the provided name identifier.
+    If the list is empty, it logs a warning with the provided name identifier;
+    callers decide whether an empty list is an error.
 
     Parameters
     ----------
     name : str
-        A descriptive name for the list, used in error logging to identify the
-        source.
+        A descriptive name for the list, used in warning logging to identify
+        the source.
     list_object : list
         The list to validate.
 
@@ -47,7 +46,7 @@ def validate_list(name: str, list_object: list) -> bool:
 
     Logging
     -------
-    Logs an error with context if the list is empty or an exception is raised.
+    Logs a warning with context if the list is empty.
 
     Example
     -------
@@ -57,12 +56,10 @@ def validate_list(name: str, list_object: list) -> bool:
     >>> validate_list("user_ids", [])
     False
     """
-    success = False
+    # sequence truth testing cannot raise for lists
+    success = bool(list_object)
 
-    try:
-        success = True if list_object else False
-        return success
+    if not success:
+        log.warning("🟡 WARNING: %s is empty.", name)
 
-    except Exception as e:
-        log.error(f"🔴 ERROR: {name} is empty.")
-        log.error(e, exc_info=True)
+    return success
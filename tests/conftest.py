@@ -0,0 +1,28 @@
+"""
+Test configuration: puts `src` on the import path and provides the
+environment settings that the utils and db modules read at import time.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(ROOT_PATH / "src"))
+
+os.environ.setdefault("LOGS_PATH", tempfile.mkdtemp())
+os.environ.setdefault("LOG_LEVEL", "INFO")
+os.environ.setdefault("SQL_PATH", str(ROOT_PATH / "sql"))
+os.environ.setdefault("DB_ROLE", "etl_test")
+
+# connection settings are read at import time but never used by the tests
+for setting in (
+    "POSTGRES_DB_NAME",
+    "POSTGRESQL_HOSTNAME",
+    "POSTGRESQL_PORT",
+    "POSTGRES_DB_USERNAME",
+    "POSTGRES_DB_PASSWORD",
+):
+    os.environ.setdefault(setting, "")
@@ -0,0 +1,92 @@
+from decimal import Decimal
+
+import pytest
+
+import db.postgresql_queries as q
+import utils.file_handler as fh
+from utils.config_handler import DESTINATION_PATH
+
+
+ROWS = [
+    (1, "back\\slash", None, 1.5, Decimal("2.50"), b"\x00\xff", True),
+    (2, "tab\there", "new\nline", None, Decimal("3"), None, False),
+    (None, "carriage\rreturn", "plain", 2.0, None, bytearray(b"z"), None),
+]
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, "\\N"),
+    (True, "t"),
+    (False, "f"),
+    (0, "0"),
+    (Decimal("1.10"), "1.10"),
+    (b"\x00\xff", "\\\\x00ff"),
+    (memoryview(b"ab"), "\\\\x6162"),
+    ("back\\slash", "back\\\\slash"),
+    ("a\tb\nc\rd", "a\\tb\\nc\\rd"),
+])
+def test_copy_value_escapes_copy_text_format(value, expected):
+    assert q.copy_value(value) == expected
+
+
+def test_copy_line_joins_fields_with_tabs():
+    assert q.copy_line((1, None, "a\tb")) == "1\t\\N\ta\\tb\n"
+
+
+def test_copy_text_matches_copy_line():
+    assert q.copy_text(ROWS) == "".join(map(q.copy_line, ROWS))
+
+
+def test_copy_text_encodes_mixed_type_columns():
+    rows = [(1, "a"), ("a\tb", 2), (None, None), (True, b"\x01")]
+
+    assert q.copy_text(rows) == "".join(map(q.copy_line, rows))
+    assert q.copy_text([(1,), ("a\tb",)]) == "1\na\\tb\n"
+
+
+def test_copy_text_accepts_iterators_and_empty_input():
+    assert q.copy_text(iter(ROWS)) == q.copy_text(ROWS)
+    assert q.copy_text([]) == ""
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 64, 4096])
+def test_copy_stream_reads_in_chunks(size):
+    stream = q.CopyStream(iter(ROWS))
+    chunks = []
+
+    while chunk := stream.read(size):
+        assert len(chunk) <= size
+        chunks.append(chunk)
+
+    assert "".join(chunks) == q.copy_text(ROWS)
+
+
+def test_copy_stream_reads_everything_without_size():
+    stream = q.CopyStream(iter(ROWS))
+
+    assert stream.read() == q.copy_text(ROWS)
+    assert stream.read() == ""
+
+
+@pytest.mark.parametrize(
+    "path",
+    sorted(DESTINATION_PATH.glob("*__INSERT.sql")),
+    ids=lambda path: path.name,
+)
+def test_copy_statement_from_insert_files(path):
+    success, query = fh.read_query_from_file(path)
+    assert success
+
+    statement = q.copy_statement_from_insert(query)
+    table = path.name.removesuffix("__INSERT.sql")
+    columns = statement.split("(", 1)[1].split(")", 1)[0].split(", ")
+
+    assert statement.startswith(f"COPY {table} (")
+    assert statement.endswith(") FROM STDIN")
+    assert len(columns) == query.count("%s")
+    assert all(column and " " not in column for column in columns)
+
+
+def test_copy_statement_from_insert_rejects_other_queries():
+    with pytest.raises(ValueError):
+        q.copy_statement_from_insert("SELECT 1;")
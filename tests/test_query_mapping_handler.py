@@ -0,0 +1,32 @@
+import utils.query_mapping_handler as qmh
+
+
+HEADER = (
+    "execution_order,is_app_table,table_id,source_query_select,"
+    "destination_query_create,destination_query_insert\n"
+)
+
+
+def test_get_mapping_data_skips_blank_lines(tmp_path):
+    mapping_file = tmp_path / "mapping.csv"
+    mapping_file.write_text(
+        HEADER
+        + "1,1,2,b__SELECT.sql,b__CREATE.sql,b__INSERT.sql\n"
+        + "\n"
+        + "0,0,,x__SELECT.sql,x__CREATE.sql,x__INSERT.sql\n"
+        + "0,1,1,a__SELECT.sql,a__CREATE.sql,a__INSERT.sql\n"
+        + "\n",
+        encoding="UTF-8",
+    )
+
+    source, destination = qmh.get_mapping_data(mapping_file)
+
+    assert source == [
+        {"execution_order": 0, "table_id": 1,
+         "source_query_select": "a__SELECT.sql"},
+        {"execution_order": 1, "table_id": 2,
+         "source_query_select": "b__SELECT.sql"},
+    ]
+    assert [table["destination_query_insert"] for table in destination] == [
+        "a__INSERT.sql", "b__INSERT.sql"
+    ]